@@ -1,20 +1,22 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from fastapi import HTTPException, status
 from loguru import logger
 from fast_users_service.db.models import Address, AddressCreate, AddressUpdate, User
 from fast_users_service.db.transactions import create as create_
-from fast_users_service.db.transactions import delete as delete_
-from fast_users_service.db.transactions import update as update_
-from sqlmodel import Session, select
+from fast_users_service.db.transactions import delete_by_id, update_by_id
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
-def create(address: AddressCreate, session: Session, current_user_id: str) -> Address:
+async def create(
+    address: AddressCreate, session: AsyncSession, current_user_id: str
+) -> Address:
     """Create an address
 
     Args:
         address (AddressCreate): An address request
-        session (Session): A DB session
+        session (AsyncSession): A DB session
         current_user_id (str): Current user ID
 
     Raises:
@@ -23,33 +25,33 @@ def create(address: AddressCreate, session: Session, current_user_id: str) -> Ad
     Returns:
         Address: An address
     """
-    if any([address.lat, address.lon]):
-        if not all([address.lat, address.lon]):
-            logger.info("Found incomplete lat/lon coords when creating address")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Incomplete coordinate values",
-            )
+    if (address.lat or address.lon) and not (address.lat and address.lon):
+        logger.info("Found incomplete lat/lon coords when creating address")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Incomplete coordinate values",
+        )
 
     address_: Address = Address.from_orm(address)
 
-    result: Address = create_(address_, session, current_user_id)
+    result: Address = await create_(address_, session, current_user_id)
 
     return result
 
 
-def get_all(
-    session: Session,
-    start: Optional[int] = None,
-    end: Optional[int] = None,
+async def get_all(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     show_deleted_records: Optional[bool] = False,
 ) -> List[Address]:
-    """Get addresses based on given query params
+    """Get addresses based on given query params, using keyset pagination
 
     Args:
-        session (Session): A DB session
-        start (Optional[int], optional): Start index. Defaults to None.
-        end (Optional[int], optional): End index. Defaults to None.
+        session (AsyncSession): A DB session
+        cursor (Optional[str], optional): ID of the last address of the previous page.
+        Defaults to None.
+        limit (Optional[int], optional): Page size. Defaults to None.
         show_deleted_records (Optional[bool], optional): Whether to respond with deleted records.
         Defaults to False.
 
@@ -59,31 +61,31 @@ def get_all(
     Returns:
         List[Address]: A list of addresses
     """
-    if end and start and end < start:
+    if limit is not None and limit < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid query params"
         )
 
     stmt = select(Address).where(Address.deleted == show_deleted_records)
-    results = session.exec(stmt)
-    addresses = results.all()
 
-    if not start:
-        start = 0
+    if cursor:
+        stmt = stmt.where(col(Address.id) > cursor)
 
-    return addresses[start : start + end] if end else addresses[start:]  # noqa
+    results = await session.exec(stmt.order_by(Address.id).limit(limit))  # type: ignore
 
+    return results.all()
 
-def get(
+
+async def get(
     id: str,
-    session: Session,
+    session: AsyncSession,
     current_user: User,
 ) -> Address:
     """Get address by its ID
 
     Args:
         id (str): An address ID
-        session (Session): A DB session
+        session (AsyncSession): A DB session
         current_user (User): Current user
 
     Raises:
@@ -94,15 +96,15 @@ def get(
         Address: An address
     """
 
-    address = session.get(Address, id)
+    address = await session.get(Address, id)
 
-    if not address or address and address.deleted:
+    if not address or address.deleted:
         logger.info("Not found address ID = {}", id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Address not found"
         )
 
-    if not any([current_user.is_admin, address.created_by == current_user.id]):
+    if not (current_user.is_admin or address.created_by == current_user.id):
         logger.info(
             "Current user ID = {} not allowed to retrive address given by ID = {}",
             current_user.id,
@@ -116,15 +118,15 @@ def get(
     return address
 
 
-def update(
-    id: str, request: AddressUpdate, session: Session, current_user: User
+async def update(
+    id: str, request: AddressUpdate, session: AsyncSession, current_user: User
 ) -> Address:
     """Update address by its ID
 
     Args:
         id (str): An address ID
         request (AddressUpdate): An address update request
-        session (Session): A DB session
+        session (AsyncSession): A DB session
         current_user (User): Current user
 
     Raises:
@@ -134,57 +136,90 @@ def update(
     Returns:
         Address: An address
     """
-    address = get(id, session, current_user)
-
-    if not address:
-        logger.info("Not found address ID = {}", id)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Address not found"
-        )
-
-    if not any([current_user.is_admin, address.created_by == current_user.id]):
-        logger.info(
-            "Current user ID = {} not allowed to update address ID = {}",
-            current_user.id,
-            id,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="User not allowed to update address",
-        )
-
-    result: Address = update_(current_user.id, address, request, session)  # type: ignore
+    result: Optional[Address] = await update_by_id(
+        current_user.id,  # type: ignore
+        Address,
+        id,
+        request,
+        session,
+        *_access_criteria(current_user),
+    )
+
+    if not result:
+        raise await _access_error(id, session, current_user, "update")
 
     return result
 
 
-def delete(id: str, session: Session, current_user: User) -> None:
+async def delete(id: str, session: AsyncSession, current_user: User) -> None:
     """Delete an address given by its ID
 
     Args:
         id (str): An address ID
-        session (Session): A DB session
+        session (AsyncSession): A DB session
         current_user (User): Current user
 
     Raises:
         HTTPException: In case address does not exist, or
         current user cannot access to it due to privileges
     """
-    address = get(id, session, current_user)
+    deleted = await delete_by_id(
+        Address,
+        id,
+        session,
+        current_user.id,  # type: ignore
+        *_access_criteria(current_user),
+    )
 
-    if not address:
+    if not deleted:
+        raise await _access_error(id, session, current_user, "delete")
+
+
+def _access_criteria(current_user: User) -> List[Any]:
+    """SQL criteria an address must match so that current user can modify it
+
+    Args:
+        current_user (User): Current user
+
+    Returns:
+        List[Any]: No criteria for admin users; ownership criteria otherwise
+    """
+    if current_user.is_admin:
+        return []
+
+    return [col(Address.created_by) == current_user.id]
+
+
+async def _access_error(
+    id: str, session: AsyncSession, current_user: User, operation: str
+) -> HTTPException:
+    """Find out why an address could not be modified
+
+    Args:
+        id (str): An address ID
+        session (AsyncSession): A DB session
+        current_user (User): Current user
+        operation (str): Operation which could not be executed
+
+    Returns:
+        HTTPException: Error to raise, whether address does not exist, or
+        current user cannot access to it due to privileges
+    """
+    address = await session.get(Address, id)
+
+    if not address or address.deleted:
         logger.info("Not found address ID = {}", id)
-        raise HTTPException(
+        return HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Address not found"
         )
 
-    if not any([current_user.is_admin, address.created_by == current_user.id]):
-        logger.info(
-            "User ID = {} not allowed not delete address ID = {}", current_user.id, id
-        )
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="User not allowed to delete address",
-        )
-
-    delete_(address, session, current_user.id)  # type: ignore
+    logger.info(
+        "Current user ID = {} not allowed to {} address ID = {}",
+        current_user.id,
+        operation,
+        id,
+    )
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"User not allowed to {operation} address",
+    )
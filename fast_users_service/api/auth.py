@@ -1,51 +1,51 @@
-from datetime import timedelta
 from typing import Union
 
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
 from fast_users_service.api.rest.enums import TokenType
 from fast_users_service.api.rest.models import Token
 from fast_users_service.api.security import create_access_token, verify_password
-from fast_users_service.api.users import get_all
-from fast_users_service.config import CONFIG
+from fast_users_service.api.users import get_by_username
+from fast_users_service.config import ACCESS_TOKEN_EXPIRES
 from fast_users_service.db.models import User
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
-def authenticate_user(
-    username: str, password: str, session: Session
+async def authenticate_user(
+    username: str, password: str, session: AsyncSession
 ) -> Union[bool, User]:
     """Verify username and password match
 
     Args:
         username (str): A username
         password (str): A plain-text password
-        session (Session): A DB session
+        session (AsyncSession): A DB session
 
     Returns:
         Union[User, bool]: User in case username and password matches,
         or False in case username it is not found or
     """
-    users = get_all(session)
-    user = list(filter(lambda obj: obj.username == username, users))
+    user = await get_by_username(username, session)
 
     if not user:
         return False
 
-    if not verify_password(password, user[0].password):
+    # NOTE: bcrypt is CPU-bound; keep it off the event loop
+    if not await run_in_threadpool(verify_password, password, user.password):
         return False
 
-    return user[0]
+    return user
 
 
-def login(username: str, password: str, session: Session) -> Token:
+async def login(username: str, password: str, session: AsyncSession) -> Token:
     """Login user by its username and password, creating an
     access token
 
     Args:
         username (str): A username
         password (str): A password
-        session (Session): A DB session
+        session (AsyncSession): A DB session
 
     Raises:
         HTTPException: In case user is not athenticated
@@ -53,7 +53,7 @@ def login(username: str, password: str, session: Session) -> Token:
     Returns:
         Token: An access token
     """
-    user = authenticate_user(username, password, session)
+    user = await authenticate_user(username, password, session)
 
     if not user:
         logger.warning("Unauthorized login attempt for username = {}", username)
@@ -63,9 +63,8 @@ def login(username: str, password: str, session: Session) -> Token:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token_expires = timedelta(minutes=int(CONFIG["security"]["jwt"]["ttl"]))
     access_token = create_access_token(
-        data={"sub": user.username, "id": user.id}, expires_delta=access_token_expires  # type: ignore
+        data={"sub": user.username, "id": user.id}, expires_delta=ACCESS_TOKEN_EXPIRES  # type: ignore
     )
 
     return Token(access_token=access_token, token_type=TokenType.bearer)
@@ -1,19 +1,27 @@
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from loguru import logger
-from fast_users_service.config import CONFIG
-from fast_users_service.db.engine import ENGINE
+from fast_users_service.config import DEFAULT_ADMIN_USERNAME
+from fast_users_service.db.engine import SESSION_FACTORY
 from fast_users_service.db.models import Configuration, ConfigurationUpdate
 from fast_users_service.db.transactions import update as update_
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+CACHE_TTL = 30  # seconds
 
-def get_all(
-    session: Session,
+# NOTE: (cached at, configuration resource); configuration changes rarely
+# and it is read on every authenticated request
+_CACHE: Optional[Tuple[float, Configuration]] = None
+
+
+async def get_all(
+    session: AsyncSession,
     start: Optional[int] = None,
     end: Optional[int] = None,
     show_deleted_records: Optional[bool] = False,
@@ -21,9 +29,10 @@ def get_all(
     """Get list of configuration resources
 
     Args:
-        session (Session): A DB session
-        start (Optional[int], optional): Start index. Defaults to None.
-        end (Optional[int], optional): End index. Defaults to None.
+        session (AsyncSession): A DB session
+        start (Optional[int], optional): Number of records to skip (OFFSET).
+        Defaults to None.
+        end (Optional[int], optional): Max number of records (LIMIT). Defaults to None.
         show_deleted_records (Optional[bool], optional): Whether to respond with deleted records.
         Defaults to False.
 
@@ -33,26 +42,32 @@ def get_all(
     Returns:
         List[Configuration]: A list of configuration resources
     """
-    if end and start and end < start:
+    if (start is not None and start < 0) or (end is not None and end < 1):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid query params"
         )
 
-    stmt = select(Configuration).where(Configuration.deleted == show_deleted_records)
-    results = session.exec(stmt)
-    configs = results.all()
-
-    if not start:
-        start = 0
+    stmt = (
+        select(Configuration)
+        .where(Configuration.deleted == show_deleted_records)
+        .order_by(Configuration.id)
+        .offset(start or 0)
+        .limit(end)
+    )
+    results = await session.exec(stmt)  # type: ignore
 
-    return configs[start : start + end] if end else configs[start:]  # noqa
+    return results.all()
 
 
-def get(session: Session) -> Configuration:
-    """Get configuration resource
+async def get(session: AsyncSession, use_cache: Optional[bool] = True) -> Configuration:
+    """Get configuration resource, from an in-process cache if it has been
+    retrieved within the last CACHE_TTL seconds
 
     Args:
-        session (Session): A DB session
+        session (AsyncSession): A DB session
+        use_cache (Optional[bool], optional): Whether a cached resource may be
+        returned. A cached resource is detached from any session, so it must not
+        be modified. Defaults to True.
 
     Raises:
         HTTPException: In case more than one resource is found
@@ -60,39 +75,57 @@ def get(session: Session) -> Configuration:
     Returns:
         Configuration: A configuration resource
     """
-    configs = get_all(session)
+    global _CACHE
+
+    if use_cache and _CACHE and time.monotonic() - _CACHE[0] < CACHE_TTL:
+        return _CACHE[1]
+
+    # NOTE: two rows are enough to tell a single resource apart from many
+    configs = await get_all(session, end=2)
 
-    if not configs or len(configs) > 1:
+    if len(configs) != 1:
         logger.error("Found more than one, or none, configuration resource")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Found more than one, or none, configuration resource",
         )
 
+    if use_cache:
+        session.expunge(configs[0])
+        _CACHE = (time.monotonic(), configs[0])
+
     return configs[0]
 
 
-def update(
-    current_user_id: str, request: ConfigurationUpdate, session: Session
+def clear_cache() -> None:
+    """Drop cached configuration resource"""
+    global _CACHE
+
+    _CACHE = None
+
+
+async def update(
+    current_user_id: str, request: ConfigurationUpdate, session: AsyncSession
 ) -> Configuration:
     """Update service configuration resource
 
     Args:
         current_user_id (str): Current user ID
         request (ConfigurationUpdate): An update resource
-        session (Session): A DB session
+        session (AsyncSession): A DB session
 
     Returns:
         Configuration: A configuration resource
     """
-    configs = get(session)
+    configs = await get(session, use_cache=False)
 
-    result: Configuration = update_(current_user_id, configs, request, session)
+    result: Configuration = await update_(current_user_id, configs, request, session)
+    clear_cache()
 
     return result
 
 
-def create_default_config() -> bool:
+async def create_default_config() -> bool:
     """Create default service configuration resource
 
     Raises:
@@ -101,27 +134,26 @@ def create_default_config() -> bool:
     Returns:
         bool: Whether operation terminated OK
     """
-    with Session(ENGINE) as session:
-        configs = get_all(session)
+    async with SESSION_FACTORY() as session:
+        configs = await get_all(session)
 
         if len(configs) > 0:  # config table has been previously created
             return False
 
-        now = str(datetime.utcnow())
+        now = datetime.utcnow()
 
         config = Configuration(
             created_at=now,
-            created_by=CONFIG["users"]["default_admin"]["username"],
+            created_by=DEFAULT_ADMIN_USERNAME,
             modified_at=now,
-            modified_by=CONFIG["users"]["default_admin"]["username"],
+            modified_by=DEFAULT_ADMIN_USERNAME,
             id=str(uuid4()),
             check_email_deliverability=False,
         )
 
         try:
             session.add(config)
-            session.commit()
-            session.refresh(config)
+            await session.commit()
 
             return True
         except Exception as exc:
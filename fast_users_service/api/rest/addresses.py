@@ -1,6 +1,7 @@
-from typing import Any, List, Optional
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import ORJSONResponse
 from fast_users_service.api.addresses import create
 from fast_users_service.api.addresses import delete as delete_
 from fast_users_service.api.addresses import get as get_
@@ -10,11 +11,13 @@ from fast_users_service.api.security import is_admin
 from fast_users_service.api.users import get_current_active_user, get_session
 from fast_users_service.db.models import (
     AddressCreate,
+    AddressPage,
     AddressResponse,
     AddressUpdate,
     User,
 )
-from sqlmodel import Session
+from fast_users_service.utils import serialize
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 ROUTER = APIRouter()
 
@@ -24,29 +27,38 @@ ROUTER = APIRouter()
     response_model=AddressResponse,
     response_model_exclude_none=True,
 )
-def create_address(
+async def create_address(
     address: AddressCreate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """Create an address"""
-    return create(address, session, current_user.id)  # type: ignore
+    result = await create(address, session, current_user.id)  # type: ignore
+
+    return ORJSONResponse(content=serialize(result, AddressResponse))
 
 
 @ROUTER.get(
     "",
-    response_model=List[AddressResponse],
+    response_model=AddressPage,
     response_model_exclude_none=True,
     dependencies=[Depends(is_admin)],
 )
-def get_addresses(
-    session: Session = Depends(get_session),
-    start: Optional[int] = 0,
-    end: Optional[int] = 50,
-    current_user: User = Depends(get_current_active_user),
+async def get_addresses(
+    session: AsyncSession = Depends(get_session),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = 50,
 ) -> Any:
-    """Get all addresses. Only admin users can execute this operation"""
-    return get_all(session, start, end)
+    """Get all addresses, a page at a time. Use the returned `next_cursor` as
+    `cursor` to retrieve the next page. Only admin users can execute this operation"""
+    addresses = await get_all(session, cursor, limit)
+
+    page = {
+        "items": [serialize(address, AddressResponse) for address in addresses],
+        "next_cursor": addresses[-1].id if limit and len(addresses) == limit else None,
+    }
+
+    return ORJSONResponse(content=page)
 
 
 @ROUTER.get(
@@ -54,14 +66,16 @@ def get_addresses(
     response_model=AddressResponse,
     response_model_exclude_none=True,
 )
-def get(
+async def get(
     id: str,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """Get address resource by its ID. Only admin users or the user who
     created the address can execute this operation"""
-    return get_(id, session, current_user)
+    result = await get_(id, session, current_user)
+
+    return ORJSONResponse(content=serialize(result, AddressResponse))
 
 
 @ROUTER.patch(
@@ -69,25 +83,27 @@ def get(
     response_model=AddressUpdate,
     response_model_exclude_none=True,
 )
-def update(
+async def update(
     id: str,
     request: AddressUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """Update address resource. Only admin users or the user who
     created the address can execute this operation"""
-    return update_(id, request, session, current_user)
+    result = await update_(id, request, session, current_user)
+
+    return ORJSONResponse(content=serialize(result, AddressUpdate))
 
 
 @ROUTER.delete("/{id}")
-def delete(
+async def delete(
     id: str,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """Delete address resource. Only admin users or the user who
     created this address can execute this operation"""
-    delete_(id, session, current_user)
+    await delete_(id, session, current_user)
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -3,14 +3,14 @@ from fastapi.security import OAuth2PasswordRequestForm
 from fast_users_service.api.auth import login as login_user
 from fast_users_service.api.rest.models import Token
 from fast_users_service.db.engine import get_session
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 ROUTER = APIRouter()
 
 
 @ROUTER.post("/token", response_model=Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ) -> Token:
-    return login_user(form_data.username, form_data.password, session)
+    return await login_user(form_data.username, form_data.password, session)
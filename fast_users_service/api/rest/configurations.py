@@ -1,16 +1,18 @@
 from typing import Any
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from fast_users_service.api.configurations import get as get_
 from fast_users_service.api.configurations import update as update_
 from fast_users_service.api.security import is_admin
-from fast_users_service.api.users import get_current_active_user, get_session
+from fast_users_service.api.users import get_session
 from fast_users_service.db.models import (
     ConfigurationResponse,
     ConfigurationUpdate,
     User,
 )
-from sqlmodel import Session
+from fast_users_service.utils import serialize
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 ROUTER = APIRouter()
 
@@ -21,24 +23,26 @@ ROUTER = APIRouter()
     response_model_exclude_none=True,
     dependencies=[Depends(is_admin)],
 )
-def get(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
+async def get(
+    session: AsyncSession = Depends(get_session),
 ) -> Any:
     """Get current service configurations properties. Only admin users can execute this operation"""
-    return get_(session)
+    result = await get_(session)
+
+    return ORJSONResponse(content=serialize(result, ConfigurationResponse))
 
 
 @ROUTER.patch(
     "",
     response_model=ConfigurationResponse,
     response_model_exclude_none=True,
-    dependencies=[Depends(is_admin)],
 )
-def update(
+async def update(
     request: ConfigurationUpdate,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(is_admin),
 ) -> Any:
     """Update current service configurations properties. Only admin users can execute this operation"""
-    return update_(current_user.id, request, session)  # type: ignore
+    result = await update_(current_user.id, request, session)  # type: ignore
+
+    return ORJSONResponse(content=serialize(result, ConfigurationResponse))
@@ -1,48 +1,81 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from fast_users_service.api.security import get_password_hash, is_admin
 from fast_users_service.api.users import create
 from fast_users_service.api.users import delete as delete_
 from fast_users_service.api.users import get as get_
-from fast_users_service.api.users import get_all, get_current_active_user, get_session
+from fast_users_service.api.users import (
+    get_all,
+    get_current_active_user,
+    get_session,
+    load_addresses,
+)
 from fast_users_service.api.users import update as update_
-from fast_users_service.db.models import User, UserCreate, UserResponse, UserUpdate
-from sqlmodel import Session
+from fast_users_service.db.models import (
+    Address,
+    AddressResponse,
+    User,
+    UserCreate,
+    UserPage,
+    UserResponse,
+    UserUpdate,
+)
+from fast_users_service.utils import serialize
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.responses import Response
 
 ROUTER = APIRouter()
 
 
+def _to_page_item(user: User, address: Optional[Address]) -> Dict[str, Any]:
+    item = serialize(user, UserResponse)
+
+    if address:
+        item["address"] = serialize(address, AddressResponse)
+
+    return item
+
+
 @ROUTER.post(
     "",
     response_model=UserResponse,
     response_model_exclude_none=True,
-    dependencies=[Depends(is_admin)],
 )
-def create_user(
+async def create_user(
     user: UserCreate,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(is_admin),
 ) -> Any:
     """Create a user. Only admin users can execute this operation"""
-    return create(user, session, current_user.id, get_password_hash)  # type: ignore
+    return await create(user, session, current_user.id, get_password_hash)  # type: ignore
 
 
 @ROUTER.get(
     "",
-    response_model=List[UserResponse],
-    response_model_exclude_none=True,
+    response_model=UserPage,
     dependencies=[Depends(is_admin)],
 )
-def get_users(
-    session: Session = Depends(get_session),
-    start: Optional[int] = 0,
-    end: Optional[int] = 50,
-    current_user: User = Depends(get_current_active_user),
+async def get_users(
+    session: AsyncSession = Depends(get_session),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = 50,
 ) -> Any:
-    """Get all users. Only admin users can execute this operation"""
-    return get_all(session, start, end)
+    """Get all users, a page at a time. Use the returned `next_cursor` as
+    `cursor` to retrieve the next page. Only admin users can execute this operation"""
+    users = await get_all(session, cursor, limit)
+    addresses = await load_addresses(users, session)
+
+    page = {
+        "items": [
+            _to_page_item(user, addresses.get(user.address_id))  # type: ignore
+            for user in users
+        ],
+        "next_cursor": users[-1].id if limit and len(users) == limit else None,
+    }
+
+    return ORJSONResponse(content=page)
 
 
 @ROUTER.get(
@@ -50,11 +83,11 @@ def get_users(
     response_model=UserResponse,
     response_model_exclude_none=True,
 )
-def get_me(
+async def get_me(
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """Get current user"""
-    return current_user
+    return ORJSONResponse(content=serialize(current_user, UserResponse))
 
 
 @ROUTER.patch(
@@ -62,13 +95,13 @@ def get_me(
     response_model=UserResponse,
     response_model_exclude_none=True,
 )
-def update_me(
+async def update_me(
     request: UserUpdate,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """Update current user"""
-    return update_(current_user.id, request, session, get_password_hash, current_user.id)  # type: ignore
+    return await update_(current_user.id, request, session, get_password_hash, current_user.id)  # type: ignore
 
 
 @ROUTER.get(
@@ -77,41 +110,41 @@ def update_me(
     response_model_exclude_none=True,
     dependencies=[Depends(is_admin)],
 )
-def get(
+async def get(
     id: str,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
+    session: AsyncSession = Depends(get_session),
 ) -> Any:
     """Get user resource given by its ID. Only admin users can execute this
     operation"""
-    return get_(id, session)
+    result = await get_(id, session)
+
+    return ORJSONResponse(content=serialize(result, UserResponse))
 
 
 @ROUTER.patch(
     "/{id}",
     response_model=UserResponse,
     response_model_exclude_none=True,
-    dependencies=[Depends(is_admin)],
 )
-def update(
+async def update(
     id: str,
     request: UserUpdate,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(is_admin),
 ) -> Any:
     """Update a user resource given by its ID. Only admin
     users can execute this operation"""
-    return update_(id, request, session, get_password_hash, current_user.id)  # type: ignore
+    return await update_(id, request, session, get_password_hash, current_user.id)  # type: ignore
 
 
-@ROUTER.delete("/{id}", dependencies=[Depends(is_admin)])
-def delete(
+@ROUTER.delete("/{id}")
+async def delete(
     id: str,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(is_admin),
 ) -> Any:
     """Delete a user resource given by its ID. Only admin users
     can execute this operation"""
-    delete_(id, session, current_user.id)  # type: ignore
+    await delete_(id, session, current_user.id)  # type: ignore
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,19 +1,23 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
+import bcrypt
+import jwt
 from fastapi import Depends, HTTPException, status
-from jose import jwt
 from loguru import logger
 from fast_users_service.api.users import get_current_active_user
-from fast_users_service.config import CONFIG
+from fast_users_service.config import (
+    ACCESS_TOKEN_EXPIRES,
+    BCRYPT_ROUNDS,
+    DEFAULT_ADMIN_ID,
+    DEFAULT_ADMIN_USERNAME,
+    JWT_SECRET_KEY,
+)
 from fast_users_service.db.models import User
-from passlib.context import CryptContext
 from fast_users_service.utils import is_valid_uuid
 
-PWD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-
-def verify_password(plain: str, hashed: str) -> Any:
+def verify_password(plain: str, hashed: str) -> bool:
     """Verify plain and hashed passwords
 
     Args:
@@ -21,9 +25,9 @@ def verify_password(plain: str, hashed: str) -> Any:
         hashed (str): A hashed password
 
     Returns:
-        Any: Whether inputs match
+        bool: Whether inputs match
     """
-    return PWD_CONTEXT.verify(plain, hashed)
+    return bcrypt.checkpw(plain.encode(), hashed.encode())
 
 
 def get_password_hash(plain: str) -> str:
@@ -35,7 +39,9 @@ def get_password_hash(plain: str) -> str:
     Returns:
         str: Hashed password
     """
-    return PWD_CONTEXT.hash(plain)  # type: ignore
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+
+    return bcrypt.hashpw(plain.encode(), salt).decode()
 
 
 def create_access_token(
@@ -51,27 +57,23 @@ def create_access_token(
         str: A JWT
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=15
-        )  # NOTE: add 15 mins as default
-
-    to_encode.update(
-        {"exp": int(expire.timestamp()), "iat": int(datetime.utcnow().timestamp())}
-    )
+    now = datetime.now(timezone.utc)
+    expire = now + (
+        expires_delta or timedelta(minutes=15)
+    )  # NOTE: add 15 mins as default
+
+    to_encode.update({"exp": int(expire.timestamp()), "iat": int(now.timestamp())})
 
     encoded_jwt = jwt.encode(
         to_encode,
-        CONFIG["security"]["jwt"]["secret_key"],
+        JWT_SECRET_KEY,
         algorithm="HS256",
     )
 
-    return encoded_jwt  # type: ignore
+    return encoded_jwt
 
 
-def is_admin(user: User = Depends(get_current_active_user)) -> None:
+async def is_admin(user: User = Depends(get_current_active_user)) -> User:
     """Checks whether user is admin
 
     Args:
@@ -79,6 +81,9 @@ def is_admin(user: User = Depends(get_current_active_user)) -> None:
 
     Raises:
         HTTPException: In case user is not admin
+
+    Returns:
+        User: Current user
     """
     if not user.is_admin:
         logger.warning(
@@ -90,6 +95,8 @@ def is_admin(user: User = Depends(get_current_active_user)) -> None:
             detail="Operation not allowed for current user",
         )
 
+    return user
+
 
 def validate_db_key(value: str, exc_msg: Optional[str] = "Bad request") -> None:
     """Validate a DB pk or fk
@@ -114,13 +121,12 @@ def impersonate_admin_user() -> str:
     Returns:
         str: A JWT
     """
-    access_token_expires = timedelta(minutes=int(CONFIG["security"]["jwt"]["ttl"]))
     access_token = create_access_token(
         data={
-            "sub": CONFIG["users"]["default_admin"]["username"],
-            "id": CONFIG["users"]["default_admin"]["id"],
+            "sub": DEFAULT_ADMIN_USERNAME,
+            "id": DEFAULT_ADMIN_ID,
         },
-        expires_delta=access_token_expires,  # noqa
+        expires_delta=ACCESS_TOKEN_EXPIRES,
     )
 
     return access_token
@@ -1,23 +1,40 @@
+import time
 from datetime import datetime, timedelta
-from typing import Callable, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from email_validator import EmailNotValidError, validate_email
 from fastapi import Depends, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from jose import ExpiredSignatureError, JWTError, jwt
+import jwt
 from loguru import logger
 from fast_users_service.api.configurations import get as get_config
 from fast_users_service.api.rest.enums import PasswordPolicyStrength
 from fast_users_service.api.rest.models import TokenData
-from fast_users_service.config import CONFIG
-from fast_users_service.db.engine import ENGINE, get_session
-from fast_users_service.db.models import Configuration, User, UserCreate, UserUpdate
+from fast_users_service.config import (
+    DEFAULT_ADMIN_ID,
+    DEFAULT_ADMIN_PASSWORD,
+    DEFAULT_ADMIN_USERNAME,
+    JWT_SECRET_KEY,
+    TOKEN_URL,
+)
+from fast_users_service.db.engine import SESSION_FACTORY, get_session
+from fast_users_service.db.models import (
+    Address,
+    Configuration,
+    User,
+    UserCreate,
+    UserUpdate,
+)
 from fast_users_service.db.transactions import create as create_
 from fast_users_service.db.transactions import delete as delete_
+from fast_users_service.db.transactions import in_array
 from fast_users_service.db.transactions import update as update_
 from password_strength import PasswordPolicy
-from sqlmodel import Session, select
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 CREDS_EXCEPTION = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -25,12 +42,27 @@ CREDS_EXCEPTION = HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
-OAUTH2_SCHEME = OAuth2PasswordBearer(tokenUrl=CONFIG["service"]["token_url"])
+OAUTH2_SCHEME = OAuth2PasswordBearer(tokenUrl=TOKEN_URL)
+
+# NOTE: policies only depend on the configured strength, so build them once
+PASSWORD_POLICIES: Dict[PasswordPolicyStrength, Tuple[PasswordPolicy, str]] = {
+    PasswordPolicyStrength.min: (
+        PasswordPolicy.from_names(length=8),
+        "Password not strong enough: must have at least 8 chars",
+    ),
+    PasswordPolicyStrength.max: (
+        PasswordPolicy.from_names(length=8, uppercase=1, numbers=1),
+        "Password not strong enough: must have at least 8 chars (1 uppercase letter, and 1 number)",
+    ),
+}
+
+# NOTE: writing last access ts on every request would turn each read into a write
+LAST_ACCESS_RESOLUTION = timedelta(minutes=1)
 
 
-def create(
+async def create(
     user: UserCreate,
-    session: Session,
+    session: AsyncSession,
     current_user_id: str,
     hash_func: Callable,
     admin: Optional[bool] = False,
@@ -39,26 +71,21 @@ def create(
 
     Args:
         user (UserCreate): Set of user properties
-        session (Session): A DB session
+        session (AsyncSession): A DB session
         hash_func (Callable): A hash function
 
     Returns:
         UserResponse: Created user
     """
     # retrieve service configs
-    config: Configuration = get_config(session)
+    config: Configuration = await get_config(session)
 
-    if config.password_policy_strength == PasswordPolicyStrength.min:
-        pwd_policy = PasswordPolicy.from_names(length=8)
-    else:
-        pwd_policy = PasswordPolicy.from_names(length=8, uppercase=1, numbers=1)
+    pwd_policy, pwd_policy_msg = PASSWORD_POLICIES[config.password_policy_strength]
 
     if not pwd_policy.test(user.password) == []:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Password not strong enough: must have at least 8 chars (1 uppercase letter, and 1 number)"
-            if config.password_policy_strength == PasswordPolicyStrength.max
-            else "Password not strong enough: must have at least 8 chars",
+            detail=pwd_policy_msg,
         )
 
     if not admin:  # TODO: review this
@@ -71,30 +98,31 @@ def create(
                 status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
             )
 
-    user.password = hash_func(user.password)
+    user.password = await run_in_threadpool(hash_func, user.password)
 
     user_: User = User.from_orm(user)
 
     if admin:  # TODO: review this
         user_.id = current_user_id  # replace auto-generated ID
 
-    result: User = create_(user_, session, current_user_id)
+    result: User = await create_(user_, session, current_user_id)
 
     return result
 
 
-def get_all(
-    session: Session,
-    start: Optional[int] = None,
-    end: Optional[int] = None,
+async def get_all(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     show_deleted_records: Optional[bool] = False,
 ) -> List[User]:
-    """Get users based on given query params
+    """Get users based on given query params, using keyset pagination
 
     Args:
-        session (Session): A DB session
-        start (Optional[int], optional): Start index. Defaults to None.
-        end (Optional[int], optional): End index. Defaults to None.
+        session (AsyncSession): A DB session
+        cursor (Optional[str], optional): ID of the last user of the previous page.
+        Defaults to None.
+        limit (Optional[int], optional): Page size. Defaults to None.
         show_deleted_records (Optional[bool], optional): Whether to respond with deleted records.
         Defaults to False.
 
@@ -104,34 +132,60 @@ def get_all(
     Returns:
         List[User]: A list of users
     """
-    if end and start and end < start:
+    if limit is not None and limit < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid query params"
         )
 
     stmt = select(User).where(User.deleted == show_deleted_records)
-    results = session.exec(stmt)
-    users = results.all()
 
-    if not start:
-        start = 0
+    if cursor:
+        stmt = stmt.where(col(User.id) > cursor)
+
+    results = await session.exec(stmt.order_by(User.id).limit(limit))  # type: ignore
+
+    return results.all()
+
+
+async def load_addresses(
+    users: List[User], session: AsyncSession
+) -> Dict[str, Address]:
+    """Load the addresses of given users within a single query, instead of
+    lazy-loading them one user at a time
+
+    Args:
+        users (List[User]): A list of users
+        session (AsyncSession): A DB session
+
+    Returns:
+        Dict[str, Address]: Non-deleted addresses by ID
+    """
+    ids = {user.address_id for user in users if user.address_id}
 
-    return users[start : start + end] if end else users[start:]  # noqa
+    if not ids:
+        return {}
 
+    stmt = select(Address).where(
+        in_array(col(Address.id), ids), col(Address.deleted).is_(False)
+    )
+    results = await session.exec(stmt)  # type: ignore
 
-def get(id: str, session: Session) -> User:
+    return {address.id: address for address in results.all()}
+
+
+async def get(id: str, session: AsyncSession) -> User:
     """Retrieve a user by its ID
 
     Args:
         id (str): An ID
-        session (Session): A DB session
+        session (AsyncSession): A DB session
 
     Returns:
         User: A user
     """
-    user = session.get(User, id)
+    user = await session.get(User, id)
 
-    if not user or user and user.deleted:
+    if not user or user.deleted:
         logger.info("Not found username ID = {}", id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -140,10 +194,26 @@ def get(id: str, session: Session) -> User:
     return user
 
 
-def update(
+async def get_by_username(username: str, session: AsyncSession) -> Optional[User]:
+    """Retrieve a user by its username
+
+    Args:
+        username (str): A username
+        session (AsyncSession): A DB session
+
+    Returns:
+        Optional[User]: A user, or None in case username is not found
+    """
+    stmt = select(User).where(User.username == username, col(User.deleted).is_(False))
+    results = await session.exec(stmt)  # type: ignore
+
+    return results.first()
+
+
+async def update(
     id: str,
     request: UserUpdate,
-    session: Session,
+    session: AsyncSession,
     hash_func: Callable,
     current_user_id: str,
 ) -> User:
@@ -152,42 +222,42 @@ def update(
     Args:
         id (str): User ID
         request (UserUpdate): A user update request
-        session (Session): A DB session
+        session (AsyncSession): A DB session
         hash_func (Callable): A hashing function
         current_user_id (str): Current user ID
 
     Returns:
         User: A user
     """
-    if id == CONFIG["users"]["default_admin"]["id"]:
+    if id == DEFAULT_ADMIN_ID:
         logger.error("Tried to udate admin user ID")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="'admin' user cannot be updated",
         )
 
-    user = get(id, session)
+    user = await get(id, session)
 
     if request.password:
-        request.password = hash_func(request.password)
+        request.password = await run_in_threadpool(hash_func, request.password)
 
-    result: User = update_(current_user_id, user, request, session)
+    result: User = await update_(current_user_id, user, request, session)
 
     return result
 
 
-def delete(id: str, session: Session, current_user_id: str) -> None:
+async def delete(id: str, session: AsyncSession, current_user_id: str) -> None:
     """Delete a user by its ID
 
     Args:
         id (str): A user ID
-        session (Session): A DB session
+        session (AsyncSession): A DB session
         current_user_id (str): Current user ID
 
     Raises:
         HTTPException: In case current user tries to delete himself
     """
-    if id == CONFIG["users"]["default_admin"]["id"]:
+    if id == DEFAULT_ADMIN_ID:
         logger.error("Tried to udate admin user ID")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -200,12 +270,12 @@ def delete(id: str, session: Session, current_user_id: str) -> None:
             status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot delete current user"
         )
 
-    user = get(id, session)
+    user = await get(id, session)
 
-    delete_(user, session, current_user_id)
+    await delete_(user, session, current_user_id)
 
 
-def create_admin(hash_func: Callable) -> bool:
+async def create_admin(hash_func: Callable) -> bool:
     """Create admin if it has not been created
     before
 
@@ -221,34 +291,26 @@ def create_admin(hash_func: Callable) -> bool:
         beforehand; True, in case admin had to be
         created
     """
-    with Session(ENGINE) as session:
-        users = get_all(session)
-
-        admin_search = list(
-            filter(
-                lambda user: user.username
-                == CONFIG["users"]["default_admin"]["username"],
-                users,
-            )
-        )
+    async with SESSION_FACTORY() as session:
+        admin = await get_by_username(DEFAULT_ADMIN_USERNAME, session)
 
-        if admin_search:  # root admin has been previously created
+        if admin:  # root admin has been previously created
             return False
 
         user = UserCreate(
             **{
-                "username": CONFIG["users"]["default_admin"]["username"],
-                "name": CONFIG["users"]["default_admin"]["username"],
-                "password": CONFIG["users"]["default_admin"]["password"],
+                "username": DEFAULT_ADMIN_USERNAME,
+                "name": DEFAULT_ADMIN_USERNAME,
+                "password": DEFAULT_ADMIN_PASSWORD,
                 "is_admin": True,
             }
         )
 
         try:
-            create(
+            await create(
                 user,
                 session,
-                CONFIG["users"]["default_admin"]["id"],
+                DEFAULT_ADMIN_ID,
                 hash_func,
                 admin=True,
             )
@@ -261,14 +323,40 @@ def create_admin(hash_func: Callable) -> bool:
             raise exc
 
 
-def get_current_user(
-    token: str = Depends(OAUTH2_SCHEME), session: Session = Depends(get_session)
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Decode a JWT and verify its signature. Results are cached by token, so a
+    token is verified only once while it is in use. Expiration is not verified
+    here, as it changes over time: callers must check it, and must not modify
+    the returned payload
+
+    Args:
+        token (str): A JWT
+
+    Raises:
+        jwt.InvalidTokenError: In case token is not valid
+
+    Returns:
+        Dict[str, Any]: Token payload
+    """
+    payload: Dict[str, Any] = jwt.decode(
+        token,
+        JWT_SECRET_KEY,
+        algorithms=["HS256"],
+        options={"verify_exp": False},
+    )
+
+    return payload
+
+
+async def get_current_user(
+    token: str = Depends(OAUTH2_SCHEME), session: AsyncSession = Depends(get_session)
 ) -> User:
     """Get current user
 
     Args:
         token (str, optional): Security token. Defaults to Depends(OAUTH2_SCHEME).
-        session (Session, optional): A DB session. Defaults to Depends(get_session).
+        session (AsyncSession, optional): A DB session. Defaults to Depends(get_session).
 
     Raises:
         creds_exception: In case credentials fail
@@ -276,67 +364,52 @@ def get_current_user(
     Returns:
         User: A user
     """
-    # retrieve service configs
-    config: Configuration = get_config(session)
-
     try:
-        payload = jwt.decode(
-            token,
-            CONFIG["security"]["jwt"]["secret_key"],
-            algorithms=["HS256"],
-        )
-        username: str = payload.get("sub")
-        user_id: str = payload.get("id")
-        token_expires_at = payload.get("exp")
-        token_iat = payload.get("iat")
-
-        if username is None or user_id is None:  # FIXME: bad constructed predicate
-            raise CREDS_EXCEPTION
-
-        # check token expiration
-        if token_expires_at is None:
-            raise CREDS_EXCEPTION
-        if (
-            int(datetime.utcnow().timestamp()) > token_expires_at
-        ):  # TODO: review this block
-            raise CREDS_EXCEPTION
-
-        token_data = TokenData(
-            username=username, id=user_id, exp=token_expires_at, iat=token_iat
-        )
-
-    except ExpiredSignatureError:  # TODO: review this block
-        if config.jwt_auto_refresh:
-            logger.warning("JWT token expired, but refreshing...")
-            token_data = TokenData(
-                username=username,
-                id=user_id,
-                exp=datetime.utcnow() + timedelta(minutes=15),
-            )
-        else:
-            raise CREDS_EXCEPTION
-    except JWTError as exc:
+        payload = _decode_token(token)
+    except jwt.InvalidTokenError as exc:
         logger.error("A JWT error occurred = {}", str(exc))
         raise CREDS_EXCEPTION
 
+    username: Optional[str] = payload.get("sub")
+    user_id: Optional[str] = payload.get("id")
+    token_expires_at = payload.get("exp")
+    token_iat = payload.get("iat")
+
+    if username is None or user_id is None:  # FIXME: bad constructed predicate
+        raise CREDS_EXCEPTION
+
+    # check token expiration
+    if token_expires_at is None:
+        raise CREDS_EXCEPTION
+    if time.time() > token_expires_at:
+        raise CREDS_EXCEPTION
+
+    token_data = TokenData(
+        username=username, id=user_id, expires_at=token_expires_at, iat=token_iat
+    )
+
     try:
-        user = get(token_data.id, session)
+        user = await get(token_data.id, session)
     except Exception as exc:
         logger.exception(
             "An exc. occurred when trying to get user from DB = {}", str(exc)
         )
         raise CREDS_EXCEPTION
 
-    # update last access ts
-    user.last_access_at = str(datetime.utcnow())
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+    # update last access ts, at most once every LAST_ACCESS_RESOLUTION
+    now = datetime.utcnow()
+
+    if not user.last_access_at or now - user.last_access_at > LAST_ACCESS_RESOLUTION:
+        user.last_access_at = now
+        session.add(user)
+        await session.commit()
 
     return user
 
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_active_user(
+    current_user: User = Depends(get_current_user),
+) -> User:
     """Check whether current user is active. In case it is blocked, raise an exc
 
     Args:
@@ -1,26 +1,65 @@
 import os
-from distutils.util import strtobool
+from datetime import timedelta
 from typing import Any, Dict
 
+# NOTE: same values distutils.util.strtobool accepted
+_ENV_FLAGS: Dict[str, bool] = {
+    **dict.fromkeys(("1", "y", "yes", "t", "true", "on"), True),
+    **dict.fromkeys(("0", "n", "no", "f", "false", "off"), False),
+}
+
+
+def _env_flag(name: str) -> bool:
+    value = os.getenv(name, "false")
+
+    try:
+        return _ENV_FLAGS[value.lower()]
+    except KeyError:
+        raise ValueError(f"Invalid truth value {value!r} for {name}") from None
+
+
+PROD_MODE = _env_flag("PROD_MODE")
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "100"))
+SQL_ECHO = _env_flag("SQL_ECHO")
+DB_URL = f"postgresql+asyncpg://{os.environ['POSTGRES_USERNAME']}:{os.environ['POSTGRES_PSW']}@{os.environ['POSTGRES_SERVER']}:{os.getenv('POSTGRES_PORT', '5432')}/users"  # noqa
+JWT_SECRET_KEY = os.environ["JWT_SECRET_KEY"]
+JWT_TTL = int(os.getenv("JWT_TTL", "30"))  # minutes
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=JWT_TTL)
+# NOTE: hashes created with other cost factors are still verified
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+DEFAULT_ADMIN_ID = "admin"
+DEFAULT_ADMIN_USERNAME = "admin"
+DEFAULT_ADMIN_PASSWORD = os.environ["ADMIN_PSW"]
+TOKEN_URL = "/fast-users/auth/token"
+
 CONFIG: Dict[str, Any] = {
     "service": {
-        "token_url": "/fast-users/auth/token",
-        "prod_mode": strtobool(os.getenv("PROD_MODE", "False")),
+        "token_url": TOKEN_URL,
+        "prod_mode": PROD_MODE,
+        "threadpool_size": THREADPOOL_SIZE,
     },
     "db": {
-        "url": f"postgresql://{os.environ['POSTGRES_USERNAME']}:{os.environ['POSTGRES_PSW']}@{os.environ['POSTGRES_SERVER']}:{os.getenv('POSTGRES_PORT', '5432')}/users",  # noqa
+        "url": DB_URL,
+        "echo": SQL_ECHO,
+        "pool": {
+            "size": int(os.getenv("POSTGRES_POOL_SIZE", "20")),
+            "max_overflow": int(os.getenv("POSTGRES_POOL_MAX_OVERFLOW", "40")),
+            "timeout": int(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),
+            "recycle": int(os.getenv("POSTGRES_POOL_RECYCLE", "3600")),
+        },
     },
     "security": {
         "jwt": {
-            "secret_key": os.environ["JWT_SECRET_KEY"],
-            "ttl": os.getenv("JWT_TTL", 30),
-        }
+            "secret_key": JWT_SECRET_KEY,
+            "ttl": JWT_TTL,
+        },
+        "bcrypt_rounds": BCRYPT_ROUNDS,
     },
     "users": {
         "default_admin": {
-            "id": "admin",
-            "username": "admin",
-            "password": os.environ["ADMIN_PSW"],
+            "id": DEFAULT_ADMIN_ID,
+            "username": DEFAULT_ADMIN_USERNAME,
+            "password": DEFAULT_ADMIN_PASSWORD,
         }
     },
 }
@@ -1,38 +1,78 @@
-from typing import Any, Dict, Iterator
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Tuple
 
-from fastapi import Depends
 from fast_users_service.api.rest.enums import DBStatus
-from fast_users_service.config import CONFIG
+from fast_users_service.config import CONFIG, DB_URL, SQL_ECHO
 from fast_users_service.db import models  # noqa
-from sqlmodel import Session, SQLModel, create_engine, select
+from loguru import logger
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-# NOTE: "echo" param must be set to False when in production mode
-ENGINE = create_engine(
-    CONFIG["db"]["url"],
-    echo=not CONFIG["service"]["prod_mode"],
-    # connect_args={"check_same_thread": False},  # NOTE: only works in SQLite
+# NOTE: SQL statements logging is expensive; only enable it for debugging
+ENGINE = create_async_engine(
+    DB_URL,
+    echo=SQL_ECHO,
+    query_cache_size=1200,
+    pool_size=CONFIG["db"]["pool"]["size"],
+    max_overflow=CONFIG["db"]["pool"]["max_overflow"],
+    pool_timeout=CONFIG["db"]["pool"]["timeout"],
+    pool_recycle=CONFIG["db"]["pool"]["recycle"],
+    pool_pre_ping=True,  # NOTE: discard stale connections before using them
 )
 
+# NOTE: attributes must not be expired on commit, as lazy-loading them
+# is not possible outside of the async context
+SESSION_FACTORY = sessionmaker(  # type: ignore
+    ENGINE, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+HEALTH_CACHE_TTL = 2  # seconds
+HEALTH_TIMEOUT = 0.5  # seconds
+
+# NOTE: (checked at, DB status)
+_LAST_HEALTH: Tuple[float, DBStatus] = (float("-inf"), DBStatus.inactive)
 
-def create_db_and_tables() -> None:
-    SQLModel.metadata.create_all(ENGINE)
 
+async def create_db_and_tables() -> None:
+    async with ENGINE.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
 
-def get_session() -> Iterator[Session]:
-    with Session(ENGINE) as session:
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    async with SESSION_FACTORY() as session:
         yield session
 
 
-def is_db_healthy(session: Session = Depends(get_session)) -> Dict[str, Any]:
-    """Database health check status
+async def _ping() -> None:
+    async with ENGINE.connect() as conn:
+        await conn.exec_driver_sql("SELECT 1")
+
 
-    Args:
-        session (Session, optional): A DB session. Defaults to Depends(get_session).
+async def is_db_healthy() -> Dict[str, Any]:
+    """Database health check status. Runs a trivial query on a raw pool
+    connection, so that no ORM session is built for each probe. Result is
+    reused for HEALTH_CACHE_TTL seconds, as probes are frequent
 
     Returns:
         Dict[str, Any]: Health check result
     """
-    stmt = select(1)  # NOTE: trivial
-    result = session.exec(stmt)
+    global _LAST_HEALTH
+
+    checked_at, db_status = _LAST_HEALTH
+
+    if time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+        return {"db_status": db_status}
+
+    try:
+        await asyncio.wait_for(_ping(), timeout=HEALTH_TIMEOUT)
+        db_status = DBStatus.active
+    except Exception as exc:
+        logger.error("DB health check failed = {}", repr(exc))
+        db_status = DBStatus.inactive
+
+    _LAST_HEALTH = (time.monotonic(), db_status)
 
-    return {"db_status": DBStatus.active if result else DBStatus.inactive}
+    return {"db_status": db_status}
@@ -1,16 +1,19 @@
-from typing import Any, Dict, Optional, Type
+import math
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Type
 from uuid import uuid4
 
 from fast_users_service.api.rest.enums import PasswordPolicyStrength
+from pydantic import validator
 from sqlmodel import Field, SQLModel
 from sqlmodel.main import Relationship
 
 
 class Auditable(SQLModel):
-    created_at: Optional[str] = Field(
+    created_at: Optional[datetime] = Field(
         description="The resource creation timestamp", default=None
     )
-    modified_at: Optional[str] = Field(
+    modified_at: Optional[datetime] = Field(
         description="The resource last modification timestamp", default=None
     )
     created_by: Optional[str] = Field(
@@ -22,7 +25,7 @@ class Auditable(SQLModel):
     deleted: bool = Field(
         default=False, description="Whether resource has been deleted"
     )
-    deleted_at: Optional[str] = Field(
+    deleted_at: Optional[datetime] = Field(
         description="Timestamp when the resource was deleted", default=None
     )
     deleted_by: Optional[str] = Field(
@@ -39,10 +42,10 @@ class ResourceTable(Auditable):
 
 class ResourceTableDBResponse(SQLModel):
     id: str
-    created_at: Optional[str] = Field(
+    created_at: Optional[datetime] = Field(
         description="The resource creation timestamp", default=None
     )
-    modified_at: Optional[str] = Field(
+    modified_at: Optional[datetime] = Field(
         description="The resource last modification timestamp", default=None
     )
     created_by: Optional[str] = Field(
@@ -53,6 +56,18 @@ class ResourceTableDBResponse(SQLModel):
     )
 
 
+class UpdateRequest(SQLModel):
+    def __init__(__pydantic_self__, **data: Any) -> None:
+        super().__init__(**data)
+        # NOTE: SQLModel marks every field as set when assigning values in
+        # __init__, which breaks partial updates relying on exclude_unset
+        object.__setattr__(
+            __pydantic_self__,
+            "__fields_set__",
+            data.keys() & __pydantic_self__.__fields__.keys(),
+        )
+
+
 class UserBase(SQLModel):
     username: str = Field(
         description="User's email to use as username",
@@ -68,7 +83,7 @@ class UserBase(SQLModel):
         default=False,
         description="Whether user is currently blocked",
     )
-    last_access_at: Optional[str] = Field(
+    last_access_at: Optional[datetime] = Field(
         description="Timestamp of last entry", default=None
     )
     is_admin: bool = Field(description="Whether user is admin", default=False)
@@ -91,7 +106,7 @@ class User(ResourceTable, UserBase, table=True):
     address: Optional["Address"] = Relationship(back_populates="user")
 
 
-class UserUpdate(SQLModel):
+class UserUpdate(UpdateRequest):
     name: Optional[str] = Field(description="Full name of the user", default=None)
     password: str = Field(description="User's password")
     first_name: Optional[str] = Field(description="First name", default=None)
@@ -118,7 +133,7 @@ class UserResponseBase(ResourceTableDBResponse):
         default=False,
         description="Whether user is currently blocked",
     )
-    last_access_at: Optional[str] = Field(
+    last_access_at: Optional[datetime] = Field(
         description="Timestamp of last entry", default=None
     )
     is_admin: bool = Field(description="Whether user is admin", default=False)
@@ -138,16 +153,13 @@ class ConfigurationBase(SQLModel):
         default=PasswordPolicyStrength.min,
         description="Password policy strength. 'min' refers to a password of length, at least, 8 chars; 'max' refers to a password of, at least, length 8 and 1 uppercase and 1 number",  # noqa
     )
-    jwt_auto_refresh: Optional[bool] = Field(
-        default=False, description="Whether to auto-refresh security token"
-    )
 
 
 class ConfigurationCreate(ConfigurationBase):
     pass
 
 
-class ConfigurationUpdate(SQLModel):
+class ConfigurationUpdate(UpdateRequest):
     check_email_deliverability: Optional[bool] = Field(
         default=False,
         description="Whether to check email deliverability when creating/updating resources where an email address is present",  # noqa
@@ -170,6 +182,14 @@ class ConfigurationResponse(ConfigurationBase):
     pass
 
 
+def _check_finite_coord(value: Optional[float]) -> Optional[float]:
+    # NOTE: orjson serializes NaN and Infinity as null, so reject them on input
+    if value is not None and not math.isfinite(value):
+        raise ValueError("Coordinate values must be finite numbers")
+
+    return value
+
+
 class AddressBase(SQLModel):
     postal_code: Optional[str] = Field(default=None, description="Postal code")
     address: str = Field(description="Full plain-text address")
@@ -179,6 +199,8 @@ class AddressBase(SQLModel):
     lat: Optional[float] = Field(default=None, description="Address' latitude")
     lon: Optional[float] = Field(default=None, description="Address' longitude")
 
+    _finite_coords = validator("lat", "lon", allow_reuse=True)(_check_finite_coord)
+
 
 class Address(ResourceTable, AddressBase, table=True):
     user: Optional["User"] = Relationship(back_populates="address")
@@ -192,7 +214,7 @@ class AddressResponseBase(ResourceTableDBResponse, AddressBase):
     pass
 
 
-class AddressUpdate(SQLModel):
+class AddressUpdate(UpdateRequest):
     postal_code: Optional[str] = Field(default=None, description="Postal code")
     address: Optional[str] = Field(default=None, description="Full plain-text address")
     country: Optional[str] = Field(default=None, description="Address' country")
@@ -201,6 +223,30 @@ class AddressUpdate(SQLModel):
     lat: Optional[float] = Field(default=None, description="Address' latitude")
     lon: Optional[float] = Field(default=None, description="Address' longitude")
 
+    _finite_coords = validator("lat", "lon", allow_reuse=True)(_check_finite_coord)
+
 
 class AddressResponse(AddressResponseBase):
     pass
+
+
+class AddressPage(SQLModel):
+    items: List[AddressResponse] = Field(description="A page of addresses")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor to retrieve the next page of addresses, if any",
+    )
+
+
+class UserWithAddressResponse(UserResponseBase):
+    address: Optional[AddressResponse] = Field(
+        default=None, description="User's full-address"
+    )
+
+
+class UserPage(SQLModel):
+    items: List[UserWithAddressResponse] = Field(description="A page of users")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor to retrieve the next page of users, if any",
+    )
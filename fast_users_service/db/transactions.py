@@ -1,22 +1,39 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable, Optional
 
 from fastapi import HTTPException, status
-from sqlmodel import Session
+from sqlalchemy import any_, literal
+from sqlalchemy import update as update_stmt
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
-def create(resource: Any, session: Session, current_user_id: str) -> Any:
+def in_array(column: Any, values: Iterable[Any]) -> Any:
+    """Build a criterion matching a column against a set of values, bound as
+    a single array parameter instead of one parameter per value
+
+    Args:
+        column (Any): A table column
+        values (Iterable[Any]): Values to match
+
+    Returns:
+        Any: A SQL criterion
+    """
+    return column == any_(literal(list(values), ARRAY(column.type)))
+
+
+async def create(resource: Any, session: AsyncSession, current_user_id: str) -> Any:
     """Create a resource
 
     Args:
         resource (Any): A resource obj
-        session (Session): A DB session
+        session (AsyncSession): A DB session
         current_user_id (str): User ID who executes the operation
 
     Returns:
         Any: Created resource
     """
-    now = str(datetime.utcnow())
+    now = datetime.utcnow()
 
     resource.created_at = now
     resource.modified_at = now
@@ -24,20 +41,21 @@ def create(resource: Any, session: Session, current_user_id: str) -> Any:
     resource.modified_by = current_user_id
 
     session.add(resource)
-    session.commit()
-    session.refresh(resource)
+    await session.commit()
 
     return resource
 
 
-def update(current_user_id: str, resource: Any, request: Any, session: Session) -> Any:
+async def update(
+    current_user_id: str, resource: Any, request: Any, session: AsyncSession
+) -> Any:
     """Update/Upsert a resource
 
     Args:
         current_user_id (str): A user ID who executes the operation
         resource (Any): A resource obj
         request (Any): An update/upsert request obj
-        session (Session): A DB session
+        session (AsyncSession): A DB session
 
     Returns:
         Any: Updated/Upserted resource
@@ -50,30 +68,108 @@ def update(current_user_id: str, resource: Any, request: Any, session: Session)
     for key, value in request.dict(exclude_unset=True).items():
         setattr(resource, key, value)
 
-    resource.modified_at = str(datetime.utcnow())
+    resource.modified_at = datetime.utcnow()
     resource.modified_by = current_user_id
 
     session.add(resource)
-    session.commit()
-    session.refresh(resource)
+    await session.commit()
 
     return resource
 
 
-def delete(resource: Any, session: Session, current_user_id: str) -> None:
+async def update_by_id(
+    current_user_id: str,
+    model: Any,
+    id: str,
+    request: Any,
+    session: AsyncSession,
+    *criteria: Any,
+) -> Optional[Any]:
+    """Update a resource by its ID within a single UPDATE statement, as long
+    as it has not been deleted and it matches the given criteria
+
+    Args:
+        current_user_id (str): A user ID who executes the operation
+        model (Any): A resource table model
+        id (str): A resource ID
+        request (Any): An update request obj
+        session (AsyncSession): A DB session
+        *criteria (Any): Additional SQL criteria the resource must match
+
+    Returns:
+        Optional[Any]: Updated resource, or None in case no resource matched
+    """
+    stmt = (
+        update_stmt(model)
+        .where(model.id == id, model.deleted.is_(False), *criteria)
+        .values(
+            **request.dict(exclude_unset=True),
+            modified_at=datetime.utcnow(),
+            modified_by=current_user_id,
+        )
+        .returning(*model.__table__.columns)
+        .execution_options(synchronize_session=False)
+    )
+
+    result = await session.execute(stmt)
+    row = result.first()
+    await session.commit()
+
+    return model(**row._mapping) if row else None
+
+
+async def delete_by_id(
+    model: Any,
+    id: str,
+    session: AsyncSession,
+    current_user_id: str,
+    *criteria: Any,
+) -> bool:
+    """Soft-Delete a resource by its ID within a single UPDATE statement, as
+    long as it has not been deleted and it matches the given criteria
+
+    Args:
+        model (Any): A resource table model
+        id (str): A resource ID
+        session (AsyncSession): A DB session
+        current_user_id (str): Current user ID
+        *criteria (Any): Additional SQL criteria the resource must match
+
+    Returns:
+        bool: Whether a resource was deleted
+    """
+    stmt = (
+        update_stmt(model)
+        .where(model.id == id, model.deleted.is_(False), *criteria)
+        .values(
+            deleted=True,
+            deleted_at=datetime.utcnow(),
+            deleted_by=current_user_id,
+        )
+        .returning(model.id)
+        .execution_options(synchronize_session=False)
+    )
+
+    result = await session.execute(stmt)
+    row = result.first()
+    await session.commit()
+
+    return row is not None
+
+
+async def delete(resource: Any, session: AsyncSession, current_user_id: str) -> None:
     """Soft-Delete a resource
 
     Args:
         resource (Any): A resource obj
-        session (Session): A DB session
+        session (AsyncSession): A DB session
         current_user_id (str): Current user ID
     """
-    now = str(datetime.utcnow())
+    now = datetime.utcnow()
 
     resource.deleted = True
     resource.deleted_at = now
     resource.deleted_by = current_user_id
 
     session.add(resource)
-    session.commit()
-    session.refresh(resource)
+    await session.commit()
@@ -1,7 +1,19 @@
 import sys
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
+if TYPE_CHECKING:
+    from loguru import Record
+
+
+def _has_context(record: "Record") -> bool:
+    return "context" in record["extra"]
+
+
+def _has_no_context(record: "Record") -> bool:
+    return "context" not in record["extra"]
+
 
 def configure(level: str = "INFO") -> None:
     logger.remove()
@@ -9,7 +21,7 @@ def configure(level: str = "INFO") -> None:
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | "
         + "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{extra[context]} {message}</level>",
-        filter=lambda record: record["extra"].get("context", False),
+        filter=_has_context,
         level=level,
         enqueue=True,
         backtrace=False,
@@ -19,7 +31,7 @@ def configure(level: str = "INFO") -> None:
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | "
         + "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        filter=lambda record: not record["extra"].get("context", None) is not None,
+        filter=_has_no_context,
         level=level,
         enqueue=True,
         backtrace=False,
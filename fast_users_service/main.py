@@ -1,46 +1,50 @@
 import uvicorn
+from anyio.to_thread import current_default_thread_limiter
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from fast_users_service.api.configurations import create_default_config
 from fast_users_service.api.rest.router import setup as setup_routers
 from fast_users_service.api.security import get_password_hash
 from fast_users_service.api.users import create_admin
-from fast_users_service.config import CONFIG
+from fast_users_service.config import DEFAULT_ADMIN_USERNAME, THREADPOOL_SIZE
 from fast_users_service.db.engine import create_db_and_tables
 from fast_users_service.logger import configure
 from fast_users_service.middleware import configure_cors
 
-APP = FastAPI(title="FastUSERS API")
+APP = FastAPI(title="FastUSERS API", default_response_class=ORJSONResponse)
 
 
 @APP.on_event("startup")
-def startup() -> None:
+async def startup() -> None:
+    # NOTE: password hashing, and sync dependencies, run on this threadpool
+    limiter = current_default_thread_limiter()
+    limiter.total_tokens = THREADPOOL_SIZE
+
     logger.info("Cofiguring CORS middleware...")
     configure_cors(APP)
 
     logger.info("Creating DB and tables...")
-    create_db_and_tables()
+    await create_db_and_tables()
 
-    if create_default_config():
+    if await create_default_config():
         logger.info(
             "Default configuration properties created. username = {}",
-            CONFIG["users"]["default_admin"]["username"],
+            DEFAULT_ADMIN_USERNAME,
         )
     else:
         logger.info(
             "Default configuration properties already created. username = {}",
-            CONFIG["users"]["default_admin"]["username"],
+            DEFAULT_ADMIN_USERNAME,
         )
 
-    if create_admin(get_password_hash):
-        logger.info(
-            "Admin created. username = {}", CONFIG["users"]["default_admin"]["username"]
-        )
+    if await create_admin(get_password_hash):
+        logger.info("Admin created. username = {}", DEFAULT_ADMIN_USERNAME)
     else:
         logger.info(
             "Admin already created. username = {}",
-            CONFIG["users"]["default_admin"]["username"],
+            DEFAULT_ADMIN_USERNAME,
         )
 
     logger.info("Setting-up routers...")
@@ -1,10 +1,33 @@
-import uuid
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Type
+
+from pydantic import BaseModel
+
+# NOTE: matches the canonical form of DB keys, i.e. str(uuid4())
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
 
 
 def is_valid_uuid(value: str) -> bool:
-    try:
-        uuid.UUID(value)
+    return _UUID_RE.fullmatch(value) is not None
+
+
+@lru_cache(maxsize=None)
+def _fields(model: Type[BaseModel]) -> FrozenSet[str]:
+    return frozenset(model.__fields__)
+
+
+def serialize(resource: Any, model: Type[BaseModel]) -> Dict[str, Any]:
+    """Serialize a resource with the fields of a response model, leaving out
+    None values, without validating the resource against the model
+
+    Args:
+        resource (Any): A resource obj
+        model (Type[BaseModel]): A response model
 
-        return True
-    except ValueError:
-        return False
+    Returns:
+        Dict[str, Any]: Serialized resource
+    """
+    return resource.dict(include=_fields(model), exclude_none=True)  # type: ignore
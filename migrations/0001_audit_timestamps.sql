@@ -0,0 +1,28 @@
+-- Audit timestamps and user.last_access_at used to be stored as VARCHAR
+-- (str(datetime.utcnow())).
+-- create_all does not alter existing tables, so databases created before
+-- they became TIMESTAMP columns must be migrated by hand:
+--
+--   psql "$DATABASE_URL" -f migrations/0001_audit_timestamps.sql
+--
+-- Casting through text keeps the script safe to re-run on TIMESTAMP columns.
+
+BEGIN;
+
+ALTER TABLE "user"
+    ALTER COLUMN created_at TYPE TIMESTAMP USING NULLIF(created_at::text, '')::timestamp,
+    ALTER COLUMN modified_at TYPE TIMESTAMP USING NULLIF(modified_at::text, '')::timestamp,
+    ALTER COLUMN deleted_at TYPE TIMESTAMP USING NULLIF(deleted_at::text, '')::timestamp,
+    ALTER COLUMN last_access_at TYPE TIMESTAMP USING NULLIF(last_access_at::text, '')::timestamp;
+
+ALTER TABLE address
+    ALTER COLUMN created_at TYPE TIMESTAMP USING NULLIF(created_at::text, '')::timestamp,
+    ALTER COLUMN modified_at TYPE TIMESTAMP USING NULLIF(modified_at::text, '')::timestamp,
+    ALTER COLUMN deleted_at TYPE TIMESTAMP USING NULLIF(deleted_at::text, '')::timestamp;
+
+ALTER TABLE configuration
+    ALTER COLUMN created_at TYPE TIMESTAMP USING NULLIF(created_at::text, '')::timestamp,
+    ALTER COLUMN modified_at TYPE TIMESTAMP USING NULLIF(modified_at::text, '')::timestamp,
+    ALTER COLUMN deleted_at TYPE TIMESTAMP USING NULLIF(deleted_at::text, '')::timestamp;
+
+COMMIT;
@@ -0,0 +1,6 @@
+-- The jwt_auto_refresh configuration flag was removed: expired tokens are
+-- always rejected. Drop its column from databases created before:
+--
+--   psql "$DATABASE_URL" -f migrations/0002_drop_jwt_auto_refresh.sql
+
+ALTER TABLE configuration DROP COLUMN IF EXISTS jwt_auto_refresh;
@@ -0,0 +1,141 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, status
+from fast_users_service.api.addresses import delete, update
+from fast_users_service.db.models import Address, AddressUpdate, User
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+pytestmark = pytest.mark.anyio
+
+OWNER = User(id="owner", username="owner@mail.com", password="x", name="Owner")
+OTHER = User(id="other", username="other@mail.com", password="x", name="Other")
+ADMIN = User(
+    id="admin", username="admin@mail.com", password="x", name="Admin", is_admin=True
+)
+
+REQUEST = AddressUpdate(city="Rosario")
+
+
+async def _create(session: AsyncSession, deleted: bool) -> Address:
+    address = Address(
+        address="Fake St. 123",
+        country="Argentina",
+        state="Santa Fe",
+        city="Santa Fe",
+        created_by=OWNER.id,
+        deleted=deleted,
+    )
+    session.add(address)
+    await session.commit()
+
+    return address
+
+
+@pytest.fixture
+async def address(session: AsyncSession) -> Address:
+    """An address owned by OWNER"""
+    return await _create(session, deleted=False)
+
+
+@pytest.fixture
+async def deleted_address(session: AsyncSession) -> Address:
+    """A soft-deleted address owned by OWNER"""
+    return await _create(session, deleted=True)
+
+
+async def _reload(session: AsyncSession, address: Address) -> Address:
+    session.expunge_all()
+    result = await session.get(Address, address.id)
+    assert result
+
+    return result
+
+
+async def test_owner_can_update_own_address(
+    session: AsyncSession, address: Address
+) -> None:
+    result = await update(address.id, REQUEST, session, OWNER)  # type: ignore
+
+    assert result.city == "Rosario"
+    assert result.modified_by == OWNER.id
+    assert (await _reload(session, address)).city == "Rosario"
+
+
+async def test_non_owner_cannot_update_address(
+    session: AsyncSession, address: Address
+) -> None:
+    with pytest.raises(HTTPException) as exc:
+        await update(address.id, REQUEST, session, OTHER)  # type: ignore
+
+    assert exc.value.status_code == status.HTTP_403_FORBIDDEN
+    assert (await _reload(session, address)).city == "Santa Fe"
+
+
+async def test_admin_can_update_any_address(
+    session: AsyncSession, address: Address
+) -> None:
+    result = await update(address.id, REQUEST, session, ADMIN)  # type: ignore
+
+    assert result.city == "Rosario"
+    assert result.created_by == OWNER.id
+    assert result.modified_by == ADMIN.id
+
+
+async def test_update_missing_address_is_not_found(
+    session: AsyncSession, address: Address
+) -> None:
+    for user in (OWNER, ADMIN):
+        with pytest.raises(HTTPException) as exc:
+            await update(str(uuid4()), REQUEST, session, user)
+
+        assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_update_deleted_address_is_not_found(
+    session: AsyncSession, deleted_address: Address
+) -> None:
+    for user in (OWNER, OTHER, ADMIN):
+        with pytest.raises(HTTPException) as exc:
+            await update(deleted_address.id, REQUEST, session, user)  # type: ignore
+
+        assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_owner_can_delete_own_address(
+    session: AsyncSession, address: Address
+) -> None:
+    await delete(address.id, session, OWNER)  # type: ignore
+
+    result = await _reload(session, address)
+
+    assert result.deleted
+    assert result.deleted_by == OWNER.id
+
+
+async def test_non_owner_cannot_delete_address(
+    session: AsyncSession, address: Address
+) -> None:
+    with pytest.raises(HTTPException) as exc:
+        await delete(address.id, session, OTHER)  # type: ignore
+
+    assert exc.value.status_code == status.HTTP_403_FORBIDDEN
+    assert not (await _reload(session, address)).deleted
+
+
+async def test_admin_can_delete_any_address(
+    session: AsyncSession, address: Address
+) -> None:
+    await delete(address.id, session, ADMIN)  # type: ignore
+
+    assert (await _reload(session, address)).deleted
+
+
+async def test_delete_missing_or_deleted_address_is_not_found(
+    session: AsyncSession, deleted_address: Address
+) -> None:
+    for id in (deleted_address.id, str(uuid4())):
+        with pytest.raises(HTTPException) as exc:
+            await delete(id, session, OWNER)  # type: ignore
+
+        assert exc.value.status_code == status.HTTP_404_NOT_FOUND
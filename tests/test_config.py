@@ -0,0 +1,54 @@
+import importlib
+from typing import Iterator
+
+import pytest
+from fast_users_service import config
+
+
+@pytest.fixture
+def reload_config(monkeypatch: pytest.MonkeyPatch) -> Iterator[pytest.MonkeyPatch]:
+    yield monkeypatch
+
+    monkeypatch.undo()
+    importlib.reload(config)
+
+
+@pytest.mark.parametrize(
+    "value", ["1", "y", "yes", "t", "true", "on", "True", "YES", "On"]
+)
+def test_truthy_env_flags(reload_config: pytest.MonkeyPatch, value: str) -> None:
+    reload_config.setenv("PROD_MODE", value)
+    reload_config.setenv("SQL_ECHO", value)
+    importlib.reload(config)
+
+    assert config.PROD_MODE is True
+    assert config.SQL_ECHO is True
+
+
+@pytest.mark.parametrize(
+    "value", ["0", "n", "no", "f", "false", "off", "False", "NO", "Off"]
+)
+def test_falsy_env_flags(reload_config: pytest.MonkeyPatch, value: str) -> None:
+    reload_config.setenv("PROD_MODE", value)
+    reload_config.setenv("SQL_ECHO", value)
+    importlib.reload(config)
+
+    assert config.PROD_MODE is False
+    assert config.SQL_ECHO is False
+
+
+def test_env_flags_default_to_false(reload_config: pytest.MonkeyPatch) -> None:
+    reload_config.delenv("PROD_MODE", raising=False)
+    reload_config.delenv("SQL_ECHO", raising=False)
+    importlib.reload(config)
+
+    assert config.PROD_MODE is False
+    assert config.SQL_ECHO is False
+
+
+@pytest.mark.parametrize("value", ["", "2", "ture", "enabled"])
+def test_unknown_env_flags_raise(reload_config: pytest.MonkeyPatch, value: str) -> None:
+    reload_config.setenv("PROD_MODE", value)
+
+    with pytest.raises(ValueError, match="PROD_MODE"):
+        importlib.reload(config)
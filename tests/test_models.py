@@ -0,0 +1,52 @@
+import math
+from typing import Optional
+
+import pytest
+from fast_users_service.db.models import (
+    AddressCreate,
+    AddressUpdate,
+    User,
+    _check_finite_coord,
+)
+from pydantic import ValidationError
+from sqlalchemy.orm import configure_mappers
+
+ADDRESS = {
+    "address": "Fake St. 123",
+    "country": "Argentina",
+    "state": "Santa Fe",
+    "city": "Santa Fe",
+}
+
+
+@pytest.mark.parametrize("value", [None, 0.0, -31.63, 180.0])
+def test_finite_coord(value: Optional[float]) -> None:
+    assert _check_finite_coord(value) == value
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_coord(value: float) -> None:
+    with pytest.raises(ValueError):
+        _check_finite_coord(value)
+
+
+@pytest.mark.parametrize("field", ["lat", "lon"])
+def test_address_requests_reject_non_finite_coords(field: str) -> None:
+    with pytest.raises(ValidationError):
+        AddressCreate(**ADDRESS, **{field: math.nan})
+
+    with pytest.raises(ValidationError):
+        AddressUpdate(**{field: math.inf})
+
+
+def test_address_update_keeps_only_given_fields() -> None:
+    request = AddressUpdate(city="Rosario", lat=-32.95)
+
+    assert request.dict(exclude_unset=True) == {"city": "Rosario", "lat": -32.95}
+
+
+def test_user_address_is_mapped() -> None:
+    # NOTE: some SQLAlchemy releases silently drop sqlmodel 0.0.6 relationships
+    configure_mappers()
+
+    assert "address" in User.__mapper__.relationships
@@ -0,0 +1,94 @@
+from typing import Any, Dict, Optional
+
+import orjson
+import pytest
+from fast_users_service.api.rest.users import get_users
+from fast_users_service.api.users import load_addresses
+from fast_users_service.db.models import Address, User
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+pytestmark = pytest.mark.anyio
+
+
+async def _add_user(
+    session: AsyncSession, id: str, address: Optional[Address] = None
+) -> User:
+    user = User(
+        id=id,
+        username=f"{id}@mail.com",
+        password="x",
+        name=id,
+        address_id=address.id if address else None,
+    )
+    session.add(user)
+    await session.commit()
+
+    return user
+
+
+async def _add_address(session: AsyncSession, deleted: bool = False) -> Address:
+    address = Address(
+        address="Fake St. 123",
+        country="Argentina",
+        state="Santa Fe",
+        city="Santa Fe",
+        deleted=deleted,
+    )
+    session.add(address)
+    await session.commit()
+
+    return address
+
+
+async def _get_users(session: AsyncSession, **params: Any) -> Dict[str, Any]:
+    response = await get_users(session, **params)
+    page: Dict[str, Any] = orjson.loads(response.body)
+
+    return page
+
+
+async def test_load_addresses(session: AsyncSession) -> None:
+    address = await _add_address(session)
+    deleted = await _add_address(session, deleted=True)
+    users = [
+        await _add_user(session, "a", address),
+        await _add_user(session, "b", deleted),
+        await _add_user(session, "c"),
+    ]
+
+    addresses = await load_addresses(users, session)
+
+    assert list(addresses) == [address.id]
+    assert await load_addresses(users[2:], session) == {}
+
+
+async def test_get_users_embeds_addresses(session: AsyncSession) -> None:
+    address = await _add_address(session)
+    deleted = await _add_address(session, deleted=True)
+    await _add_user(session, "a", address)
+    await _add_user(session, "b", deleted)
+    await _add_user(session, "c")
+
+    page = await _get_users(session)
+    items = {item["id"]: item for item in page["items"]}
+
+    assert list(items) == ["a", "b", "c"]
+    assert page["next_cursor"] is None
+    assert items["a"]["address"]["id"] == address.id
+    assert items["a"]["address"]["city"] == "Santa Fe"
+    assert "address" not in items["b"]
+    assert "address" not in items["c"]
+    assert all("password" not in item for item in items.values())
+
+
+async def test_get_users_pages_with_cursor(session: AsyncSession) -> None:
+    for id in ("a", "b", "c"):
+        await _add_user(session, id)
+
+    first = await _get_users(session, limit=2)
+    second = await _get_users(session, cursor=first["next_cursor"], limit=2)
+
+    assert [item["id"] for item in first["items"]] == ["a", "b"]
+    assert first["next_cursor"] == "b"
+    assert [item["id"] for item in second["items"]] == ["c"]
+    assert second["next_cursor"] is None
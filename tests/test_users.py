@@ -0,0 +1,102 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import jwt
+import pytest
+from fastapi import HTTPException, status
+from fast_users_service.api.security import create_access_token
+from fast_users_service.api.users import _decode_token, get_current_user
+from fast_users_service.config import JWT_SECRET_KEY
+from fast_users_service.db.models import User
+
+USER = User(id="user", username="user@mail.com", password="x", name="User")
+
+
+class FakeSession:
+    """Serves a single user, and fails on any write"""
+
+    def __init__(self, user: Optional[User] = None) -> None:
+        self.user = user
+
+    async def get(self, model: Any, id: str) -> Optional[User]:
+        return self.user if self.user and self.user.id == id else None
+
+    def add(self, resource: Any) -> None:
+        raise AssertionError("Unexpected write")
+
+
+def _token(
+    expires_delta: timedelta = timedelta(minutes=5),
+    data: Optional[Dict[str, Any]] = None,
+) -> str:
+    return create_access_token(
+        data or {"sub": USER.username, "id": USER.id}, expires_delta
+    )
+
+
+def _get_current_user(token: str, session: FakeSession) -> User:
+    return asyncio.run(get_current_user(token, session))  # type: ignore
+
+
+def test_decode_token_returns_payload() -> None:
+    payload = _decode_token(_token())
+
+    assert payload["sub"] == USER.username
+    assert payload["id"] == USER.id
+    assert payload["exp"] > payload["iat"]
+
+
+def test_decode_token_rejects_bad_signature() -> None:
+    token = jwt.encode(
+        {"sub": USER.username, "id": USER.id}, "y" * 32, algorithm="HS256"
+    )
+
+    with pytest.raises(jwt.InvalidTokenError):
+        _decode_token(token)
+
+
+def test_decode_token_rejects_malformed_token() -> None:
+    with pytest.raises(jwt.InvalidTokenError):
+        _decode_token("not-a-jwt")
+
+
+def test_decode_token_does_not_verify_expiration() -> None:
+    payload = _decode_token(_token(timedelta(minutes=-5)))
+
+    assert payload["exp"] < time.time()
+
+
+def test_current_user_from_valid_token() -> None:
+    USER.last_access_at = datetime.utcnow()
+
+    assert _get_current_user(_token(), FakeSession(USER)) is USER
+
+
+def test_expired_token_is_rejected() -> None:
+    with pytest.raises(HTTPException) as exc:
+        _get_current_user(_token(timedelta(seconds=-1)), FakeSession(USER))
+
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.parametrize(
+    "data", [{"id": USER.id}, {"sub": USER.username}, {"sub": "x", "id": "unknown"}]
+)
+def test_token_without_known_user_is_rejected(data: Dict[str, Any]) -> None:
+    with pytest.raises(HTTPException) as exc:
+        _get_current_user(_token(data=data), FakeSession(USER))
+
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_token_without_expiration_is_rejected() -> None:
+    token = jwt.encode(
+        {"sub": USER.username, "id": USER.id}, JWT_SECRET_KEY, algorithm="HS256"
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        _get_current_user(token, FakeSession(USER))
+
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
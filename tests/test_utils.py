@@ -0,0 +1,41 @@
+from uuid import uuid4
+
+import pytest
+from fast_users_service.db.models import User, UserResponse
+from fast_users_service.utils import is_valid_uuid, serialize
+
+
+def test_is_valid_uuid() -> None:
+    value = str(uuid4())
+
+    assert is_valid_uuid(value)
+    assert is_valid_uuid(value.upper())
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "admin",
+        str(uuid4()) + "\n",
+        " " + str(uuid4()),
+        str(uuid4()).replace("-", ""),
+        "{%s}" % uuid4(),
+        "urn:uuid:%s" % uuid4(),
+        str(uuid4())[:-1] + "g",
+    ],
+)
+def test_is_not_valid_uuid(value: str) -> None:
+    assert not is_valid_uuid(value)
+
+
+def test_serialize_uses_response_model_fields() -> None:
+    user = User(id="user", username="user@mail.com", password="secret", name="User")
+
+    result = serialize(user, UserResponse)
+
+    assert "password" not in result
+    assert "first_name" not in result  # None values are left out
+    assert result["id"] == "user"
+    assert result["username"] == "user@mail.com"
+    assert result["is_admin"] is False